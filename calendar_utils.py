@@ -1,12 +1,23 @@
+import asyncio
 import os
-import json
 import datetime
-import pytz
+import hashlib
+import threading
+import time
+
+import orjson
+import requests.adapters
+from zoneinfo import ZoneInfo
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import groupby
+from operator import itemgetter
 from google.oauth2 import service_account
-from googleapiclient.discovery import build
+from google.auth.transport.requests import AuthorizedSession
 
 SCOPES = ["https://www.googleapis.com/auth/calendar.readonly"]
-zona_local = pytz.timezone("America/Argentina/Buenos_Aires")
+EVENTS_URL = "https://www.googleapis.com/calendar/v3/calendars/{cal_id}/events"
+zona_local = ZoneInfo("America/Argentina/Buenos_Aires")
+UTC = datetime.timezone.utc
 
 CALENDAR_IDS = {
     "Sala grande": "dq9te3mprqg1ljp5tnjpb8v6ns@group.calendar.google.com",
@@ -15,16 +26,48 @@ CALENDAR_IDS = {
     "Sala terraza": "adso7d591imkgl4s1e7vom5npk@group.calendar.google.com",
 }
 
+# Slug normalizado por calendario, precalculado acá para que los endpoints
+# no tengan que re-derivar la sala evento por evento.
+ROOM_SLUGS = {
+    "Sala grande": "grande",
+    "Sala piano": "piano",
+    "Sala piccola": "piccola",
+    "Sala terraza": "terraza",
+}
+
+# Argentina es UTC-3 fijo (sin DST vigente): el cambio de zona del parser
+# rápido es una suma de minutos, sin pasar por la maquinaria tzinfo.
+_LOCAL_OFFSET_MIN = -180
+
 def _parse_dt(value: str) -> datetime.datetime:
     """
-    Convierte dateTime ISO (con Z o con offset) a datetime aware en zona_local.
+    Convierte el dateTime RFC3339 de Google ('YYYY-MM-DDTHH:MM:SS±HH:MM'
+    o con 'Z') a datetime aware en zona_local. El layout es fijo, así que
+    se corta con slicing + int() y el offset se aplica con un timedelta;
+    cualquier formato raro cae al parser general de fromisoformat.
     """
-    # Google suele devolver 'Z' en UTC
-    if value.endswith("Z"):
-        value = value.replace("Z", "+00:00")
+    try:
+        if len(value) >= 20 and value[10] == "T":
+            tail = value[19:]
+            if tail == "Z":
+                off = 0
+            elif len(tail) == 6 and tail[3] == ":" and tail[0] in "+-":
+                off = int(tail[1:3]) * 60 + int(tail[4:6])
+                if tail[0] == "-":
+                    off = -off
+            else:
+                raise ValueError(value)
+            local = datetime.datetime(
+                int(value[0:4]), int(value[5:7]), int(value[8:10]),
+                int(value[11:13]), int(value[14:16]), int(value[17:19]),
+            ) + datetime.timedelta(minutes=_LOCAL_OFFSET_MIN - off)
+            return local.replace(tzinfo=zona_local)
+    except ValueError:
+        pass
+
     dt = datetime.datetime.fromisoformat(value)
     if dt.tzinfo is None:
-        dt = pytz.utc.localize(dt)
+        dt = dt.replace(tzinfo=UTC)
     return dt.astimezone(zona_local)
 
 def _localize_date(date_str: str) -> datetime.datetime:
@@ -33,85 +76,260 @@ def _localize_date(date_str: str) -> datetime.datetime:
     Creamos un datetime local a medianoche en zona_local (aware).
     """
     y, m, d = map(int, date_str.split("-"))
-    return zona_local.localize(datetime.datetime(y, m, d, 0, 0, 0))
+    return datetime.datetime(y, m, d, tzinfo=zona_local)
+
+# Sesión autenticada singleton (lazy): parsear GOOGLE_CREDENTIALS_JSON y
+# construir las credenciales cuesta solo una vez por proceso, y la sesión
+# reusa las conexiones TLS contra googleapis.com entre requests.
+_session = None
+_session_lock = threading.Lock()
+
+def _get_session() -> AuthorizedSession:
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                info = orjson.loads(os.environ["GOOGLE_CREDENTIALS_JSON"])
+                creds = service_account.Credentials.from_service_account_info(info, scopes=SCOPES)
+                session = AuthorizedSession(creds)
+                # Pool dimensionado para el fan-out: los 4 calendarios se
+                # piden en paralelo contra el mismo host, y mantener las
+                # conexiones keep-alive evita rehacer el handshake TLS
+                # (~100-200 ms) en cada llenado de cache.
+                adapter = requests.adapters.HTTPAdapter(
+                    pool_connections=len(CALENDAR_IDS),
+                    pool_maxsize=len(CALENDAR_IDS),
+                )
+                session.mount("https://", adapter)
+                _session = session
+    return _session
+
+# Estado de sincronización incremental por calendario: con syncToken Google
+# devuelve solo los cambios desde la última llamada (casi vacío en régimen),
+# así que en caliente el payload por calendario es prácticamente cero.
+_sync_tokens = {}   # {cal_id: nextSyncToken}
+_event_store = {}   # {cal_id: {event_id: item crudo vigente}}
+
+def _sync_calendar(session: AuthorizedSession, cal_id: str, time_min: str, time_max: str) -> list:
+    """
+    Devuelve los items vigentes de un calendario vía la API REST directa,
+    usando sincronización incremental: la primera vez baja la ventana
+    completa y guarda el nextSyncToken; las siguientes piden solo deltas.
+    Un HTTP 410 significa token vencido y fuerza un re-sync completo.
+    """
+    store = _event_store.setdefault(cal_id, {})
+    token = _sync_tokens.get(cal_id)
+
+    # Proyección de campos: la normalización solo usa id/status/summary/
+    # start/end, y pedir únicamente eso achica el payload de Google varias
+    # veces (afuera quedan attendees, descripciones, reminders, etc.).
+    fields = "items(id,status,summary,start,end),nextPageToken,nextSyncToken"
+
+    if token:
+        params = {"syncToken": token, "singleEvents": "true", "maxResults": 2500, "fields": fields}
+    else:
+        store.clear()
+        # Sin orderBy: es incompatible con syncToken y el orden final
+        # lo resuelve el sort de la lista normalizada.
+        params = {
+            "timeMin": time_min,
+            "timeMax": time_max,
+            "singleEvents": "true",
+            "maxResults": 2500,
+            "fields": fields,
+        }
+
+    while True:
+        resp = session.get(EVENTS_URL.format(cal_id=cal_id), params=params, timeout=15)
+        if resp.status_code == 410:
+            # Token vencido: Google pide rearrancar con un sync completo.
+            _sync_tokens.pop(cal_id, None)
+            return _sync_calendar(session, cal_id, time_min, time_max)
+        resp.raise_for_status()
+        # orjson parsea la respuesta más rápido que el json de requests
+        data = orjson.loads(resp.content)
+
+        for item in data.get("items", []):
+            if item.get("status") == "cancelled":
+                store.pop(item.get("id"), None)
+            else:
+                store[item["id"]] = item
+
+        page_token = data.get("nextPageToken")
+        if not page_token:
+            new_token = data.get("nextSyncToken")
+            if new_token:
+                _sync_tokens[cal_id] = new_token
+            break
+        params["pageToken"] = page_token
+
+    return list(store.values())
+
+# Cache en memoria de la lista normalizada: las ráfagas de requests del GPT
+# repiten la misma ventana de 14 días y no hace falta ir a Google cada vez.
+# El TTL se puede ajustar por entorno sin tocar código (segundos).
+CACHE_TTL_SECONDS = int(os.environ.get("EVENTOS_CACHE_TTL", "45"))
+
+_cache_lock = threading.Lock()
+_cache_key = None     # (fecha_inicio, fecha_fin) de la ventana cacheada
+_cache_ts = 0.0
+_cache_eventos = None
+_cache_by_date = None   # {fecha_iso: [eventos]} derivado de la misma lista
+_cache_etag = None    # hash de la lista normalizada, para If-None-Match
+
+def get_eventos_etag():
+    """
+    ETag de la lista cacheada. Se recalcula una vez por llenado de cache,
+    así que solo cambia cuando cambian los eventos.
+    """
+    return _cache_etag
 
 def get_eventos():
-    service_account_info = json.loads(os.environ["GOOGLE_CREDENTIALS_JSON"])
-    creds = service_account.Credentials.from_service_account_info(service_account_info, scopes=SCOPES)
-    service = build("calendar", "v3", credentials=creds)
+    """
+    Devuelve la lista normalizada de eventos de los próximos 14 días.
+    Sirve desde cache si la misma ventana se pidió hace < CACHE_TTL_SECONDS;
+    el lock hace de "single flight": un solo fetch por expiración.
+    """
+    global _cache_key, _cache_ts, _cache_eventos, _cache_by_date, _cache_etag
 
     hoy = datetime.datetime.now(zona_local)
     inicio = hoy.replace(hour=0, minute=0, second=0, microsecond=0)
     fin = inicio + datetime.timedelta(days=14)
+    key = (inicio.date(), fin.date())
+
+    with _cache_lock:
+        if _cache_eventos is not None and _cache_key == key and time.time() - _cache_ts < CACHE_TTL_SECONDS:
+            return _cache_eventos
+
+        if key != _cache_key:
+            # Cambió la ventana (pasó un día): los syncTokens viejos cubren
+            # otra ventana, rearrancamos con un sync completo.
+            _sync_tokens.clear()
+            _event_store.clear()
+
+        eventos = _fetch_eventos(inicio, fin)
+        _cache_key = key
+        _cache_ts = time.time()
+        _cache_eventos = eventos
+        # Índice por fecha, armado una vez por llenado: las consultas de un
+        # solo día (p. ej. /salas_libres) miran solo los eventos de esa
+        # fecha en vez de barrer la ventana completa. La lista ya viene
+        # ordenada por fecha, así que un groupby alcanza.
+        _cache_by_date = {fecha: list(evs) for fecha, evs in groupby(eventos, key=itemgetter("fecha"))}
+        _cache_etag = hashlib.blake2b(orjson.dumps(eventos), digest_size=8).hexdigest()
+        return eventos
 
-    time_min = inicio.astimezone(pytz.utc).isoformat()
-    time_max = fin.astimezone(pytz.utc).isoformat()
+def get_eventos_por_fecha():
+    """
+    Índice {fecha_iso: [eventos]} de la misma ventana cacheada. Refresca
+    el cache si hace falta y devuelve el dict armado en el último llenado.
+    """
+    get_eventos()
+    return _cache_by_date
+
+async def aget_eventos_por_fecha():
+    """Versión async de get_eventos_por_fecha (mismo criterio que aget_eventos)."""
+    return await asyncio.to_thread(get_eventos_por_fecha)
+
+async def aget_eventos():
+    """
+    Versión async de get_eventos para los endpoints: corre el fetch
+    bloqueante (requests + google-auth) en un thread del pool, así el
+    event loop sigue atendiendo requests mientras Google responde. El
+    lock del cache ya serializa los llenados, y en cache hit el thread
+    vuelve en microsegundos.
+    """
+    return await asyncio.to_thread(get_eventos)
+
+def _fetch_eventos(inicio: datetime.datetime, fin: datetime.datetime):
+    session = _get_session()
+
+    time_min = inicio.astimezone(UTC).isoformat()
+    time_max = fin.astimezone(UTC).isoformat()
 
     eventos_json = []
 
-    for nombre_cal, cal_id in CALENDAR_IDS.items():
-        items = (
-            service.events()
-            .list(
-                calendarId=cal_id,
-                timeMin=time_min,
-                timeMax=time_max,
-                singleEvents=True,
-                orderBy="startTime",
-                showDeleted=False,
-                maxResults=2500,
-            )
-            .execute()
-            .get("items", [])
-        )
+    # Las 4 llamadas HTTP son independientes: en paralelo cuestan ~1 RTT en
+    # vez de 4. Con as_completed, cada calendario se normaliza apenas llega
+    # su respuesta, solapando el CPU con la cola de red del más lento.
+    with ThreadPoolExecutor(max_workers=len(CALENDAR_IDS)) as executor:
+        futures = {
+            executor.submit(_sync_calendar, session, cal_id, time_min, time_max): nombre_cal
+            for nombre_cal, cal_id in CALENDAR_IDS.items()
+        }
+        for fut in as_completed(futures):
+            eventos_json.extend(_normalize_items(futures[fut], fut.result()))
 
-        for event in items:
-            start = event.get("start", {})
-            end = event.get("end", {})
+    # Orden estable para consumo: (fecha, room, hora_inicio) con itemgetter
+    # (comparador en C). Se ordena una sola vez por llenado de cache; los
+    # endpoints consumen la lista ya ordenada sin re-sortear por request.
+    eventos_json.sort(key=itemgetter("fecha", "room", "hora_inicio"))
+    return eventos_json
 
-            start_dt = start.get("dateTime")
-            start_date = start.get("date")
-            end_dt = end.get("dateTime")
-            end_date = end.get("date")
+def _normalize_items(nombre_cal: str, items: list) -> list:
+    eventos_json = []
+    for event in items:
+        titulo = event.get("summary", "Sin título")
+        start = event.get("start", {})
+        end = event.get("end", {})
 
-            # Timed event
-            if start_dt and end_dt:
-                dt_start = _parse_dt(start_dt)
-                dt_end = _parse_dt(end_dt)
+        start_dt = start.get("dateTime")
+        start_date = start.get("date")
+        end_dt = end.get("dateTime")
+        end_date = end.get("date")
 
-                hora_inicio = dt_start.strftime("%H:%M")
-                hora_fin = dt_end.strftime("%H:%M")
-                duracion_min = int((dt_end - dt_start).total_seconds() // 60)
+        # Timed event
+        if start_dt and end_dt:
+            dt_start = _parse_dt(start_dt)
+            dt_end = _parse_dt(end_dt)
 
-                fecha_iso = dt_start.date().isoformat()
+            # f-string sobre los atributos: evita el parser de formato
+            # (y el paso por locale) de strftime en el loop caliente.
+            hora_inicio = f"{dt_start.hour:02d}:{dt_start.minute:02d}"
+            hora_fin = f"{dt_end.hour:02d}:{dt_end.minute:02d}"
+            duracion_min = int((dt_end - dt_start).total_seconds() // 60)
 
-            # All-day event
-            elif start_date and end_date:
-                # En all-day, end.date es el día siguiente (fin exclusivo).
-                dt_start = _localize_date(start_date)
-                fecha_iso = dt_start.date().isoformat()
+            # Minutos desde medianoche local: los endpoints comparan y
+            # recortan intervalos con aritmética de ints, sin re-parsear
+            # los strings HH:MM.
+            start_min = dt_start.hour * 60 + dt_start.minute
+            end_min = dt_end.hour * 60 + dt_end.minute
 
-                hora_inicio = ""
-                hora_fin = ""
-                duracion_min = None
+            fecha_iso = dt_start.date().isoformat()
+
+        # All-day event
+        elif start_date and end_date:
+            # En all-day, end.date es el día siguiente (fin exclusivo).
+            dt_start = _localize_date(start_date)
+            fecha_iso = dt_start.date().isoformat()
+
+            hora_inicio = ""
+            hora_fin = ""
+            duracion_min = None
+            start_min = None
+            end_min = None
+
+        else:
+            # evento raro/incompleto
+            continue
+
+        eventos_json.append(
+            {
+                "calendario": nombre_cal,
+                "sala": nombre_cal,  # alias explícito
+                "room": ROOM_SLUGS.get(nombre_cal, nombre_cal.lower()),
+                "fecha": fecha_iso,  # ✅ CLAVE: YYYY-MM-DD
+                "hora_inicio": hora_inicio,
+                "hora_fin": hora_fin,
+                "start_min": start_min,
+                "end_min": end_min,
+                "duracion": duracion_min,
+                "titulo": titulo,
+                # Minúsculas una sola vez acá: los filtros por texto
+                # (teacher) comparan contra esto sin lower() por request.
+                "titulo_lower": titulo.lower(),
+                "event_id": event.get("id"),
+            }
+        )
 
-            else:
-                # evento raro/incompleto
-                continue
-
-            eventos_json.append(
-                {
-                    "calendario": nombre_cal,
-                    "sala": nombre_cal,  # alias explícito
-                    "fecha": fecha_iso,  # ✅ CLAVE: YYYY-MM-DD
-                    "hora_inicio": hora_inicio,
-                    "hora_fin": hora_fin,
-                    "duracion": duracion_min,
-                    "titulo": event.get("summary", "Sin título"),
-                    "event_id": event.get("id"),
-                }
-            )
-
-    # Orden estable para consumo
-    eventos_json.sort(key=lambda e: (e["fecha"], e["calendario"], e["hora_inicio"] or ""))
     return eventos_json
@@ -1,12 +1,38 @@
-from fastapi import FastAPI, Query
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
 from typing import Optional, List, Dict, Tuple
-from calendar_utils import get_eventos
+from calendar_utils import aget_eventos, aget_eventos_por_fecha, get_eventos_etag
+from contextlib import asynccontextmanager
 import datetime
-import pytz
 import re
 
-app = FastAPI()
-zona_local = pytz.timezone("America/Argentina/Buenos_Aires")
+import orjson
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
+from zoneinfo import ZoneInfo
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Pre-calentar el cache de eventos al arrancar: el primer request real
+    # no paga el fetch completo a Google. Si Google falla en el arranque,
+    # el primer request lo reintenta; no queremos que el deploy caiga.
+    try:
+        await aget_eventos()
+    except Exception:
+        pass
+    yield
+
+# orjson serializa las respuestas (listas de dicts) varias veces más rápido
+# que el json de la stdlib.
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
+
+# JSON con claves repetidas comprime 5-10x; nivel 5 es el punto justo entre
+# ratio y CPU para respuestas de este tamaño. Solo actúa desde 1 KiB.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+zona_local = ZoneInfo("America/Argentina/Buenos_Aires")
 
 # -----------------------------
 # Normalización / parse helpers
@@ -21,127 +47,223 @@ ROOM_ALIASES = {
 
 ALL_ROOMS = ["piano", "grande", "piccola", "terraza"]
 
-TIME_RE = re.compile(r"^\d{2}:\d{2}$")
+# Alias -> sala canónica, más un regex con todas las alternativas en un solo
+# patrón (largo desc. para que "sala piccola" gane sobre "piccola"): un único
+# scan del string en vez de un `in` por alias.
+_ALIAS_TO_ROOM = {a: room for room, aliases in ROOM_ALIASES.items() for a in aliases}
+_ALIAS_RE = re.compile("|".join(map(re.escape, sorted(_ALIAS_TO_ROOM, key=len, reverse=True))))
 
+@lru_cache(maxsize=256)
 def normalize_room(calendario: str) -> str:
     c = (calendario or "").strip().lower()
-    for room, aliases in ROOM_ALIASES.items():
-        if any(a in c for a in aliases):
-            return room
+    m = _ALIAS_RE.search(c)
+    if m:
+        return _ALIAS_TO_ROOM[m.group(0)]
     return c or "desconocida"
 
 def parse_hhmm(hhmm: str) -> datetime.time:
-    if not TIME_RE.match(hhmm):
-        raise ValueError(f"Hora inválida: {hhmm} (formato HH:MM)")
-    h, m = hhmm.split(":")
-    return datetime.time(int(h), int(m), 0)
-
+    """
+    Formato fijo HH:MM: slicing + int() directo, sin regex ni strptime.
+    """
+    try:
+        if len(hhmm) == 5 and hhmm[2] == ":":
+            return datetime.time(int(hhmm[0:2]), int(hhmm[3:5]), 0)
+    except ValueError:
+        pass
+    raise ValueError(f"Hora inválida: {hhmm} (formato HH:MM)")
+
+@lru_cache(maxsize=256)
 def parse_date_any(date_str: str) -> datetime.date:
     """
-    Acepta 'YYYY-MM-DD' o 'DD/MM/YYYY'.
+    Acepta 'YYYY-MM-DD' o 'DD/MM/YYYY'. Ambos formatos tienen largo fijo,
+    así que se resuelve con slicing + int() en vez de regex/strptime.
+    Memoizada: en una ventana de 14 días hay a lo sumo 14 fechas distintas,
+    así que dentro de un request casi todo es hit de cache.
     """
     s = (date_str or "").strip()
-    if re.match(r"^\d{4}-\d{2}-\d{2}$", s):
-        y, m, d = map(int, s.split("-"))
-        return datetime.date(y, m, d)
-    if re.match(r"^\d{2}/\d{2}/\d{4}$", s):
-        d, m, y = map(int, s.split("/"))
-        return datetime.date(y, m, d)
+    if len(s) == 10:
+        try:
+            if s[4] == "-" and s[7] == "-":
+                return datetime.date(int(s[0:4]), int(s[5:7]), int(s[8:10]))
+            if s[2] == "/" and s[5] == "/":
+                return datetime.date(int(s[6:10]), int(s[3:5]), int(s[0:2]))
+        except ValueError:
+            pass
     raise ValueError(f"Fecha inválida: {date_str} (usar YYYY-MM-DD o DD/MM/YYYY)")
 
+def _parse_param_date(s: str) -> datetime.date:
+    """
+    parse_date_any para parámetros de query: una fecha malformada es un
+    error del cliente (400), no un 500 del server.
+    """
+    try:
+        return parse_date_any(s)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+def _parse_param_hhmm(s: str) -> int:
+    try:
+        return hhmm_to_min(s)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+def _parse_window(from_date: Optional[str], to_date: Optional[str]) -> Tuple[datetime.date, datetime.date]:
+    """
+    Parsea y valida el rango de fechas de una vez, antes de tocar Google:
+    un rango invertido o absurdo es un 400 inmediato, sin fetch de por medio.
+    """
+    start = _parse_param_date(from_date) if from_date else datetime.datetime.now(zona_local).date()
+    # Sin to_date, el default son 14 días desde start (no desde hoy): un
+    # from_date futuro solo no es un rango invertido.
+    end = _parse_param_date(to_date) if to_date else (start + datetime.timedelta(days=13))
+    if end < start:
+        raise HTTPException(status_code=400, detail=f"Rango inválido: to_date ({end}) anterior a from_date ({start})")
+    if (end - start).days > 90:
+        raise HTTPException(status_code=400, detail="Rango inválido: máximo 90 días")
+    return start, end
+
 def date_to_iso(d: datetime.date) -> str:
     return d.isoformat()
 
 def dt_on_date(date_str: str, hhmm: str) -> datetime.datetime:
     d = parse_date_any(date_str)
     t = parse_hhmm(hhmm)
-    dt = datetime.datetime(d.year, d.month, d.day, t.hour, t.minute, 0)
-    return zona_local.localize(dt)
+    # zoneinfo se puede adjuntar directo en el constructor (sin localize)
+    return datetime.datetime(d.year, d.month, d.day, t.hour, t.minute, 0, tzinfo=zona_local)
 
 def minus_one_min(dt: datetime.datetime) -> datetime.datetime:
     return dt - datetime.timedelta(minutes=1)
 
-def minutes_between(a: datetime.datetime, b: datetime.datetime) -> int:
-    return int((b - a).total_seconds() // 60)
+def hhmm_to_min(hhmm: str) -> int:
+    t = parse_hhmm(hhmm)
+    return t.hour * 60 + t.minute
+
+def min_to_hhmm(m: int) -> str:
+    return f"{m // 60:02d}:{m % 60:02d}"
+
+# Los intervalos de /salas_libres se manejan como minutos desde medianoche
+# (ints): comparar y recortar ints es mucho más barato que datetimes aware.
 
-def clamp_interval(s: datetime.datetime, e: datetime.datetime, ws: datetime.datetime, we: datetime.datetime):
+def clamp_interval(s: int, e: int, ws: int, we: int) -> Optional[List[int]]:
     s2, e2 = max(s, ws), min(e, we)
     if s2 >= e2:
         return None
-    return (s2, e2)
+    return [s2, e2]
 
-def merge_intervals(intervals: List[Tuple[datetime.datetime, datetime.datetime]]) -> List[Tuple[datetime.datetime, datetime.datetime]]:
+def sweep_free(intervals: List[List[int]], ws: int, we: int, min_minutes: int) -> Tuple[List[List[str]], List[list]]:
     """
-    Merge de intervalos ocupados (asume start<=end).
-    Considera 'pegados' como un solo bloque ocupado si s <= prev_end.
+    Un solo barrido sobre los intervalos ocupados (pares mutables
+    [start, end], ya recortados a la ventana): ordena, fusiona los que se
+    tocan extendiendo el bloque actual, y emite los huecos libres al cerrar
+    cada bloque. Devuelve (busy, free) ya formateados en HH:MM; free trae
+    solo los huecos >= min_minutes, con la duración como tercer elemento.
+    Reemplaza al par merge + compute_free: mismo resultado, una pasada y
+    sin lista intermedia.
     """
     if not intervals:
-        return []
-    intervals = sorted(intervals, key=lambda x: x[0])
-    merged = [intervals[0]]
-    for s, e in intervals[1:]:
-        ps, pe = merged[-1]
-        if s <= pe:
-            merged[-1] = (ps, max(pe, e))
-        else:
-            merged.append((s, e))
-    return merged
+        mins = we - ws
+        free = [[min_to_hhmm(ws), min_to_hhmm(we), mins]] if mins >= min_minutes else []
+        return [], free
 
-def compute_free(busy_merged: List[Tuple[datetime.datetime, datetime.datetime]],
-                 ws: datetime.datetime, we: datetime.datetime) -> List[Tuple[datetime.datetime, datetime.datetime]]:
-    free = []
+    intervals.sort(key=itemgetter(0))
+    busy_out: List[List[str]] = []
+    free_out: List[list] = []
     cursor = ws
-    for s, e in busy_merged:
-        if cursor < s:
-            free.append((cursor, s))
-        cursor = max(cursor, e)
-    if cursor < we:
-        free.append((cursor, we))
-    return free
+    cs, ce = intervals[0]
+    for s, e in intervals[1:]:
+        if s <= ce:
+            if e > ce:
+                ce = e
+        else:
+            busy_out.append([min_to_hhmm(cs), min_to_hhmm(ce)])
+            if cs - cursor >= min_minutes:
+                free_out.append([min_to_hhmm(cursor), min_to_hhmm(cs), cs - cursor])
+            cursor = ce
+            cs, ce = s, e
+    busy_out.append([min_to_hhmm(cs), min_to_hhmm(ce)])
+    if cs - cursor >= min_minutes:
+        free_out.append([min_to_hhmm(cursor), min_to_hhmm(cs), cs - cursor])
+    cursor = ce
+    if we - cursor >= min_minutes:
+        free_out.append([min_to_hhmm(cursor), min_to_hhmm(we), we - cursor])
+    return busy_out, free_out
 
 # -----------------------------
 # Endpoints
 # -----------------------------
 
+# Respuestas estáticas serializadas una sola vez al importar: los health
+# checks de Render pegan cada pocos segundos y no hay nada que recalcular.
+_ROOT_RESP = Response(
+    content=orjson.dumps({"mensaje": "¡API funcionando! Visitá /agenda para ver la agenda. También tenés /agenda_json y /salas_libres."}),
+    media_type="application/json",
+)
+_HEALTH_RESP = Response(content=b'{"status":"ok"}', media_type="application/json")
+
 @app.get("/")
-def root():
-    return {"mensaje": "¡API funcionando! Visitá /agenda para ver la agenda. También tenés /agenda_json y /salas_libres."}
+async def root():
+    return _ROOT_RESP
+
+@app.get("/healthz")
+async def healthz():
+    return _HEALTH_RESP
 
 @app.get("/agenda")
-def agenda():
+async def agenda(request: Request):
     """
     Mantiene tu endpoint original: devuelve un texto grande dentro de {"agenda": "..."}.
     """
-    eventos = get_eventos()
-    agrupado: Dict[str, List[dict]] = {}
-    for ev in eventos:
-        fecha = ev.get("fecha")
-        if not fecha:
-            continue
-        agrupado.setdefault(fecha, []).append(ev)
+    # aget_eventos corre el fetch bloqueante en un thread: el event loop
+    # queda libre para atender otros requests mientras Google responde.
+    eventos = await aget_eventos()
+
+    # Si el cliente ya tiene esta versión de los eventos, 304 sin cuerpo.
+    etag = get_eventos_etag()
+    if etag and request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
 
     hoy = datetime.datetime.now(zona_local)
     lunes = hoy - datetime.timedelta(days=hoy.weekday())
     domingo = lunes + datetime.timedelta(days=13)
-    titulo = f"📅 Agenda (2 semanas, del {lunes.strftime('%d/%m')} al {domingo.strftime('%d/%m')}):"
+    titulo = f"📅 Agenda (2 semanas, del {lunes.day:02d}/{lunes.month:02d} al {domingo.day:02d}/{domingo.month:02d}):"
 
     lines = [titulo]
-    if not agrupado:
-        lines.append("\n⛔ No hay eventos cargados en los próximos 14 días.")
-    else:
-        for fecha in sorted(agrupado):
-            lines.append(f"\n📆 {fecha}")
-            for e in sorted(agrupado[fecha], key=lambda x: (x.get("calendario",""), x.get("hora_inicio",""))):
-                if e.get("hora_inicio") and e.get("hora_fin"):
-                    duracion_txt = f" ({e.get('duracion')} min)" if e.get("duracion") else ""
-                    lines.append(f"  {e['hora_inicio']} - {e['hora_fin']}{duracion_txt} - {e.get('titulo','')} ({e.get('calendario','')})")
+    # get_eventos() ya viene ordenado por (fecha, room, hora_inicio), así que
+    # un solo groupby recorre la lista sin armar dict intermedio ni re-sortear
+    # cada grupo por request.
+    for fecha, evs in groupby((ev for ev in eventos if ev.get("fecha")), key=itemgetter("fecha")):
+        lines.append(f"\n📆 {fecha}")
+        # Una sola lectura de cada campo y un único f-string por línea
+        # (sin armar 'duracion_txt' intermedio por evento).
+        for e in evs:
+            hi = e.get("hora_inicio")
+            hf = e.get("hora_fin")
+            tit = e.get("titulo", "")
+            cal = e.get("calendario", "")
+            if hi and hf:
+                dur = e.get("duracion")
+                if dur:
+                    lines.append(f"  {hi} - {hf} ({dur} min) - {tit} ({cal})")
                 else:
-                    lines.append(f"  Todo el día - {e.get('titulo','')} ({e.get('calendario','')})")
+                    lines.append(f"  {hi} - {hf} - {tit} ({cal})")
+            else:
+                lines.append(f"  Todo el día - {tit} ({cal})")
+
+    if len(lines) == 1:
+        lines.append("\n⛔ No hay eventos cargados en los próximos 14 días.")
 
-    return {"agenda": "\n".join(lines)}
+    # ORJSONResponse directo: evita el paso por jsonable_encoder de FastAPI.
+    resp = ORJSONResponse({"agenda": "\n".join(lines)})
+    if etag:
+        # max-age alineado con el TTL del cache de eventos: dentro de esa
+        # ventana el cliente ni siquiera necesita el round-trip del 304.
+        resp.headers["ETag"] = etag
+        resp.headers["Cache-Control"] = "public, max-age=30"
+    return resp
 
 @app.get("/agenda_json")
-def agenda_json(
+async def agenda_json(
+    request: Request,
     from_date: Optional[str] = Query(default=None, description="YYYY-MM-DD o DD/MM/YYYY (default: hoy)"),
     to_date: Optional[str] = Query(default=None, description="YYYY-MM-DD o DD/MM/YYYY (default: hoy+13)"),
     room: Optional[str] = Query(default=None, description="piano|grande|piccola|terraza"),
@@ -150,17 +272,38 @@ def agenda_json(
     """
     Devuelve eventos estructurados (para que el GPT no 'interprete' texto).
     """
-    eventos = get_eventos()
+    # Validar el rango antes del fetch: input malformado no gasta red.
+    start, end = _parse_window(from_date, to_date)
+
+    # aget_eventos corre el fetch bloqueante en un thread: el event loop
+    # queda libre para atender otros requests mientras Google responde.
+    eventos = await aget_eventos()
 
-    hoy = datetime.datetime.now(zona_local).date()
-    start = parse_date_any(from_date) if from_date else hoy
-    end = parse_date_any(to_date) if to_date else (hoy + datetime.timedelta(days=13))
+    # Si el cliente ya tiene esta versión de los eventos, 304 sin cuerpo.
+    etag = get_eventos_etag()
+    if etag and request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
 
-    room_norm = room.strip().lower() if room else None
+    # Normalizar los parámetros una sola vez acá arriba: adentro del loop
+    # solo quedan comparaciones directas contra strings ya canónicos.
+    room_norm = normalize_room(room) if room else None
     teacher_l = teacher.strip().lower() if teacher else None
 
     out = []
     for ev in eventos:
+        # Los filtros baratos van primero: con filtro de sala activo, la
+        # comparación directa contra el slug precalculado descarta ~3/4 de
+        # los eventos antes de parsear ninguna fecha.
+        # 'room' viene precalculado desde calendar_utils; normalize_room queda
+        # solo para entradas que no pasaron por la normalización del fetch.
+        room_ev = ev.get("room") or normalize_room(ev.get("calendario", ""))
+        if room_norm and room_ev != room_norm:
+            continue
+
+        title = (ev.get("titulo") or "")
+        if teacher_l and teacher_l not in (ev.get("titulo_lower") or title.lower()):
+            continue
+
         fecha_raw = ev.get("fecha")
         if not fecha_raw:
             continue
@@ -174,17 +317,14 @@ def agenda_json(
         if f < start or f > end:
             continue
 
-        room_ev = normalize_room(ev.get("calendario", ""))
-        if room_norm and room_ev != room_norm:
-            continue
-
-        title = (ev.get("titulo") or "")
-        if teacher_l and teacher_l not in title.lower():
-            continue
-
-        # end_real para cálculo/razonamiento (si hay horas)
+        # end_real para cálculo/razonamiento (si hay horas): resta de ints
+        # sobre end_min precalculado, sin construir un datetime por evento.
         end_real = None
-        if ev.get("hora_fin"):
+        end_min = ev.get("end_min")
+        if end_min:
+            end_real = min_to_hhmm(end_min - 1)
+        elif ev.get("hora_fin"):
+            # Eventos sin end_min (no pasaron por la normalización del fetch)
             try:
                 end_real = minus_one_min(dt_on_date(fecha_raw, ev["hora_fin"])).strftime("%H:%M")
             except Exception:
@@ -201,96 +341,115 @@ def agenda_json(
             "title": title,
         })
 
-    out.sort(key=lambda x: (x["date"], x["room"], x["start"] or ""))
-    return {
+    # get_eventos() ya viene ordenado por (fecha, room, hora_inicio) y el
+    # filtro preserva ese orden, así que no hace falta re-sortear acá.
+    resp = ORJSONResponse({
         "timezone": "America/Argentina/Buenos_Aires",
         "range": {"from": date_to_iso(start), "to": date_to_iso(end)},
         "events": out
-    }
+    })
+    if etag:
+        resp.headers["ETag"] = etag
+        resp.headers["Cache-Control"] = "public, max-age=30"
+    return resp
 
 @app.get("/salas_libres")
-def salas_libres(
+async def salas_libres(
     date: str = Query(..., description="YYYY-MM-DD o DD/MM/YYYY"),
     window_from: str = Query(..., alias="from", description="HH:MM"),
     window_to: str = Query(..., alias="to", description="HH:MM"),
     min_minutes: int = Query(30, alias="min", ge=1, description="mínimo de minutos para considerar hueco"),
+    rooms: Optional[str] = Query(None, description="CSV de salas a considerar (ej: piano,grande)"),
 ):
     """
     Devuelve BUSY y FREE por sala dentro de una ventana horaria,
     aplicando la regla ECM: fin real = fin - 1 minuto.
     """
-    eventos = get_eventos()
-
-    ws = dt_on_date(date, window_from)
-    we = dt_on_date(date, window_to)
-
-    # Agrupar BUSY por sala
-    busy_by_room: Dict[str, List[Tuple[datetime.datetime, datetime.datetime]]] = {r: [] for r in ALL_ROOMS}
-
-    for ev in eventos:
-        fecha_raw = ev.get("fecha")
-        if not fecha_raw:
-            continue
-
-        try:
-            f = parse_date_any(fecha_raw)
-            target = parse_date_any(date)
-        except Exception:
-            continue
+    # Validar los parámetros antes del fetch: input malformado no gasta red.
+    target = _parse_param_date(date)
+    target_iso = target.isoformat()
+    ws = _parse_param_hhmm(window_from)
+    we = _parse_param_hhmm(window_to)
+    if we <= ws:
+        raise HTTPException(status_code=400, detail=f"Ventana inválida: to ({window_to}) no es posterior a from ({window_from})")
+
+    # Índice por fecha armado una vez por llenado de cache: una consulta
+    # de un día mira solo los eventos de esa fecha, no la ventana entera.
+    por_fecha = await aget_eventos_por_fecha()
+
+    # Filtro opcional de salas: se normaliza el CSV una sola vez acá y el
+    # resto del endpoint (el scan de eventos incluido) trabaja solo sobre
+    # las salas pedidas.
+    if rooms:
+        wanted = [r for r in ALL_ROOMS if r in {normalize_room(p) for p in rooms.split(",")}]
+        if not wanted:
+            raise HTTPException(status_code=400, detail=f"Salas desconocidas: {rooms}")
+    else:
+        wanted = ALL_ROOMS
 
-        if f != target:
-            continue
+    # Agrupar BUSY por sala (intervalos en minutos desde medianoche)
+    busy_by_room: Dict[str, List[List[int]]] = {r: [] for r in wanted}
 
-        room_ev = normalize_room(ev.get("calendario", ""))
+    for ev in por_fecha.get(target_iso, ()):
+        room_ev = ev.get("room") or normalize_room(ev.get("calendario", ""))
 
         # si llega una sala desconocida, la ignoramos (o podés sumarla)
         if room_ev not in busy_by_room:
             continue
 
-        # Evento todo el día: bloquea toda la ventana
-        if not ev.get("hora_inicio") or not ev.get("hora_fin"):
-            busy_by_room[room_ev].append((ws, we))
-            continue
+        s = ev.get("start_min")
+        e = ev.get("end_min")
 
-        try:
-            s = dt_on_date(date, ev["hora_inicio"])
-            e = dt_on_date(date, ev["hora_fin"])
-        except Exception:
+        # Evento todo el día: bloquea toda la ventana
+        if s is None or e is None:
+            busy_by_room[room_ev].append([ws, we])
             continue
 
-        e_real = minus_one_min(e)
+        e_real = e - 1  # regla ECM: fin real = fin - 1 minuto
         clamped = clamp_interval(s, e_real, ws, we)
         if clamped:
             busy_by_room[room_ev].append(clamped)
 
     rooms_out = []
-    for room in ALL_ROOMS:
-        merged = merge_intervals(busy_by_room.get(room, []))
-        free = compute_free(merged, ws, we)
-
-        busy_out = [[s.strftime("%H:%M"), e.strftime("%H:%M")] for s, e in merged]
-
-        free_out = []
-        for fs, fe in free:
-            mins = minutes_between(fs, fe)
-            if mins >= min_minutes:
-                free_out.append([fs.strftime("%H:%M"), fe.strftime("%H:%M"), mins])
-
+    for room in wanted:
+        busy_out, free_out = sweep_free(busy_by_room[room], ws, we, min_minutes)
         rooms_out.append({
             "room": room,
             "busy": busy_out,
             "free": free_out
         })
 
-    return {
+    return ORJSONResponse({
         "timezone": "America/Argentina/Buenos_Aires",
-        "date": date_to_iso(parse_date_any(date)),
+        "date": target_iso,
         "from": window_from,
         "to": window_to,
         "min": min_minutes,
         "rooms": rooms_out
-    }
+    })
 
 if __name__ == "__main__":
+    import os
     import uvicorn
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
+
+    port = int(os.environ.get("PORT", 8000))
+
+    if os.getenv("DEV") == "1":
+        # Runner de desarrollo con autoreload (watchfiles).
+        uvicorn.run("main:app", host="0.0.0.0", port=port, reload=True)
+    else:
+        # Producción (Render): uvloop + httptools rinden bastante más que el
+        # loop asyncio y el parser HTTP por defecto, y el access log de
+        # uvicorn loguea sincrónicamente sobre el event loop, así que afuera.
+        # PORT lo inyecta Render; WEB_CONCURRENCY ajusta los workers según
+        # el CPU del plan (cada worker tiene su propio cache de eventos).
+        uvicorn.run(
+            "main:app",
+            host="0.0.0.0",
+            port=port,
+            workers=int(os.environ.get("WEB_CONCURRENCY", 2)),
+            loop="uvloop",
+            http="httptools",
+            access_log=False,
+            timeout_keep_alive=30,
+        )